@@ -1,9 +1,12 @@
 import warnings
 import copy
-import more_itertools
 
 class Contents:
 
+    # Arraytainers are often nested many levels deep, so avoid giving every instance a __dict__; 
+    # subclasses must declare any attributes they add in their own __slots__:
+    __slots__ = ('_contents', '_type')
+
     _convert_to_contents = (tuple, list, dict)
 
     #
@@ -17,10 +20,22 @@ class Contents:
         return object.__new__(cls)
 
     def __init__(self, contents, nested=True, **kwargs):
-        self._contents = self._preprocess_contents(contents)
+        self._init_attributes(self._preprocess_contents(contents))
         if nested:
             self._nested_convert_to_contents(kwargs)
 
+    @classmethod
+    def _from_canonical(cls, contents):
+        # Creates container directly from contents which doesn't need to be copied or converted:
+        container = cls.__new__(cls)
+        container._init_attributes(contents)
+        return container
+
+    def _init_attributes(self, contents):
+        self._contents = contents
+        # Contents never changes between being dict-like and list-like, so only check type once:
+        self._type = self._get_contents_type(contents)
+
     def _preprocess_contents(self, contents):
 
         if self._get_contents_type(contents) is dict:
@@ -37,12 +52,12 @@ class Contents:
         return self._deepcopy_contents(contents)
 
     def _nested_convert_to_contents(self, kwargs):
-        for key, val in self.items():
+        for key, val in self._iter_items(self._contents):
             if isinstance(val, self._convert_to_contents):
                 self._contents[key] = self.__class__(val, **kwargs)
 
     def _check_keys(self, keys):
-        for key in more_itertools.always_iterable(keys):
+        for key in keys:
             if isinstance(key, tuple):
                 raise KeyError(f'The key {key} is a tuple, which are not allowed in {self.__class__.__name__}.')
 
@@ -54,10 +69,6 @@ class Contents:
     def _get_contents_type(val):
         return dict if hasattr(val, 'keys') else list
 
-    @property
-    def _type(self):
-        return self._get_contents_type(self._contents)
-
     def __len__(self):
         return len(self._contents)
 
@@ -68,14 +79,14 @@ class Contents:
     #   Copying Methods
     #
 
-    # deepcopy changes jnp.array np.array, so Jaxtainer overloads this method:
-
+    # Copied contents are already in the right form, so skip the conversion done by the constructor:
     def __copy__(self):
-        return self.__class__(self.unpack())
+        return self._from_canonical(self._deepcopy_contents(self._contents))
 
     def __deepcopy__(self, memo):
-        return self.__class__(copy.deepcopy(self.unpack()))
+        return self.__copy__()
 
+    # deepcopy changes jnp.array np.array, so Jaxtainer overloads this method:
     @staticmethod
     def _deepcopy_contents(contents):
         return copy.deepcopy(contents)
@@ -83,8 +94,15 @@ class Contents:
     def copy(self):
         return self.__copy__()
 
-    def deepcopy(contents):
-        return self.__deepcopy__()
+    def deepcopy(self):
+        return copy.deepcopy(self)
+
+    # Only contents is pickled; any other attributes are recomputed from it when unpickling:
+    def __getstate__(self):
+        return {'contents': self._contents}
+
+    def __setstate__(self, state):
+        self._init_attributes(state['contents'])
 
     #
     #   Iterator Methods
@@ -107,6 +125,16 @@ class Contents:
 
     def __iter__(self):
         return iter(self._contents)
+
+    @property
+    def _keyset(self):
+        return frozenset(self.keys())
+
+    def _has_key(self, key):
+        # Checks a single key without listing every key in contents:
+        if self._type is dict:
+            return key in self._contents
+        return key in range(len(self._contents))
     
     #
     #   Getter Methods
@@ -138,14 +166,23 @@ class Contents:
         return item
 
     def unpack(self):
-        unpacked = []
-        for val in self.values():
-            if isinstance(val, Contents):
-                unpacked.append(val.unpack())
-            else:
-                unpacked.append(val)
-        if self._type is dict:
-            unpacked = dict(zip(self.keys(), unpacked))
+        return self._unpack_and_apply()
+
+    def _unpack_and_apply(self, func=None):
+        # Unpacks nested containers level-by-level (rather than recursively), optionally 
+        # applying func to every value which isn't a container:
+        unpacked = self._contents.copy()
+        to_unpack = [unpacked]
+        while to_unpack:
+            contents = to_unpack.pop()
+            keys = contents.keys() if isinstance(contents, dict) else range(len(contents))
+            for key in keys:
+                val = contents[key]
+                if isinstance(val, Contents):
+                    contents[key] = val._contents.copy()
+                    to_unpack.append(contents[key])
+                elif func is not None:
+                    contents[key] = func(val)
         return unpacked
     
     @property
@@ -177,48 +214,48 @@ class Contents:
         return self._contents
 
     def list_keys(self):
-        return self._get_elements_and_keys(self.unpack(), return_elements=False, return_keys=True)
+        return self._get_elements_and_keys(return_elements=False, return_keys=True)
 
     def list_elements(self):
-        return self._get_elements_and_keys(self.unpack(), return_elements=True, return_keys=False)
+        return self._get_elements_and_keys(return_elements=True, return_keys=False)
 
     def list_items(self):
-        return self._get_elements_and_keys(self.unpack(), return_elements=True, return_keys=True)
+        return self._get_elements_and_keys(return_elements=True, return_keys=True)
 
-    @staticmethod
-    def _get_elements_and_keys(contents, return_elements, return_keys, output_list=None, key_list=None):
-        
-        if output_list is None:
-            output_list = []
+    def _get_elements_and_keys(self, return_elements, return_keys):
         
-        if isinstance(contents, list):
-            keys = range(len(contents))  
-        else:
-            keys = contents.keys()
-
-        key_list_copy = copy.copy(key_list)
-        for key in keys:
-
-            if return_keys:
-                if key_list_copy is None:
-                    key_list = [key]
-                else:
-                    key_list = [*key_list_copy, key]
-
-            if isinstance(contents[key], (dict,list)):
-                output_list = \
-                Contents._get_elements_and_keys(contents[key], return_elements, return_keys, output_list, key_list)
-            else:
+        output_list = []
+
+        # Depth-first walk using a stack of (key path, items iterator) pairs, so that elements 
+        # are listed in the same order as they'd be visited recursively:
+        to_visit = [((), self._iter_items(self._contents))]
+        while to_visit:
+            key_list, items_iter = to_visit[-1]
+            for key, val in items_iter:
+                
+                if isinstance(val, Contents):
+                    val = val._contents
+                
+                if isinstance(val, (dict, list)):
+                    # Finish with nested contents before returning to this level:
+                    to_visit.append(((*key_list, key), self._iter_items(val)))
+                    break
 
                 if return_elements and return_keys:
-                    output_list.append((tuple(key_list), contents[key]))
+                    output_list.append(((*key_list, key), val))
                 elif return_keys:
-                    output_list.append(tuple(key_list))
+                    output_list.append((*key_list, key))
                 elif return_elements:
-                    output_list.append(contents[key])
+                    output_list.append(val)
+            else:
+                to_visit.pop()
         
         return output_list
 
+    @staticmethod
+    def _iter_items(contents):
+        return iter(contents.items()) if isinstance(contents, dict) else enumerate(contents)
+
     def tolist(self):
         output = {}
         for key, val in self.items():
@@ -234,7 +271,7 @@ class Contents:
 
     def __setitem__(self, key, new_value):
         
-        self._check_keys(key)
+        self._check_keys((key,))
 
         if isinstance(new_value, self._convert_to_contents):
             new_value = self.__class__(new_value)
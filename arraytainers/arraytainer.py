@@ -1,12 +1,17 @@
 from ._contents import Contents
 import copy
+import functools
 import numbers
 import numpy as np
-import more_itertools
 
 class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
 
+    __slots__ = ('_stacked',)
+
     _arrays = (np.ndarray,)
+    # Jaxtainers must apply jnp functions to their arrays, so they don't use stacked arrays:
+    _can_store_stacked = True
+    _stacked_scalar_types = (numbers.Number, np.generic)
 
     #
     #   Constructor Methods
@@ -25,6 +30,14 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
 
         super().__init__(contents, nested, greedy=greedy) #convert_arrays=convert_arrays
 
+        if self._can_store_stacked:
+            self._store_stacked_if_possible()
+
+    def _init_attributes(self, contents):
+        super()._init_attributes(contents)
+        # Either None or (stacked array, keys, views of stacked array):
+        self._stacked = None
+
     @classmethod
     def from_array(cls, array, shapes, order='C', convert_arrays=True, greedy=False, nested=True):
         
@@ -49,6 +62,11 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
 
     @classmethod
     def _concatenate_elements_to_array(cls, val_tuple):
+
+        # Usual case of a single shapes arraytainer (e.g. from the shape property) needs no concatenation; 
+        # any zero-dimensional shape arrays in it are handled by methods which use these shapes:
+        if len(val_tuple) == 1 and isinstance(val_tuple[0], Arraytainer):
+            return val_tuple[0]
         
         val_list = list(val_tuple)
 
@@ -69,36 +87,159 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
         return np.concatenate(val_list)
 
     @classmethod
-    def _create_contents_from_vector(cls, vector, shapes, order, elem_idx=None, first_call=True):
+    def _create_contents_from_vector(cls, vector, shapes, order):
+        
+        new_contents, leaf_slots, leaf_shapes = cls._flatten_shape_tree(shapes)
 
-        if elem_idx is None:
-            elem_idx = 0
+        # Split vector into all of the arrays in a single call, rather than slicing out one array at a time:
+        leaf_sizes = np.fromiter((np.prod(shape, dtype=int) for shape in leaf_shapes), dtype=np.intp, count=len(leaf_shapes))
+        split_idxs = np.cumsum(leaf_sizes)[:-1]
+        array_vals = cls._split_vector(vector, split_idxs)
 
-        new_contents = {}
-        for key, shape in shapes.items():
-            if isinstance(shape, Arraytainer):
-                new_contents[key], elem_idx = cls._create_contents_from_vector(vector, shape, order, elem_idx, first_call=False)
-            else:
-                array_vals, elem_idx = cls._extract_array_vals(vector, elem_idx, shape)
-                new_contents[key] = array_vals.reshape(shape, order=order)
+        for (container, key), vals, shape in zip(leaf_slots, array_vals, leaf_shapes):
+            container[key] = vals.reshape(shape, order=order)
 
-        if shapes._type is list:
-            new_contents = list(new_contents.values())
+        return new_contents
 
-        if first_call:
-            output = new_contents
-        else:
-            output = (new_contents, elem_idx)
+    @staticmethod
+    def _flatten_shape_tree(shapes):
         
-        return output
- 
+        # Creates empty dict/list skeleton matching the structure of shapes, and records (in order) 
+        # where in that skeleton each array should be placed, along with that array's shape:
+        new_contents = {} if shapes._type is dict else [None]*len(shapes)
+        leaf_slots, leaf_shapes = [], []
+        to_visit = [(new_contents, shapes.items())]
+        while to_visit:
+            container, shapes_iter = to_visit[-1]
+            for key, shape in shapes_iter:
+                if isinstance(shape, Arraytainer):
+                    container[key] = {} if shape._type is dict else [None]*len(shape)
+                    # Finish filling nested container before returning to this one:
+                    to_visit.append((container[key], shape.items()))
+                    break
+                container[key] = None
+                leaf_slots.append((container, key))
+                leaf_shapes.append(tuple(int(dim) for dim in np.atleast_1d(shape)))
+            else:
+                to_visit.pop()
+
+        return new_contents, leaf_slots, leaf_shapes
+
     @staticmethod
-    def _extract_array_vals(vector, elem_idx, shape):
+    def _split_vector(vector, split_idxs):
         # Jaxtainer version of this method uses jnp methods instead of np:
-        num_elem = np.prod(shape)
-        array_vals = vector[elem_idx:elem_idx+num_elem]
-        elem_idx += num_elem
-        return array_vals, elem_idx
+        return np.split(vector, split_idxs)
+
+    #
+    #   Stacked Array Methods
+    #
+
+    # If contents only contains arrays of the same shape and dtype, these arrays are stored as views of a
+    # single stacked array, so that element-wise functions can be applied to all of them in one call:
+
+    def _store_stacked_if_possible(self):
+        vals = list(self._contents.values()) if self._type is dict else self._contents
+        if len(vals) < 2:
+            return
+        first_val = vals[0]
+        for val in vals:
+            if type(val) is not np.ndarray or val.shape != first_val.shape or val.dtype != first_val.dtype:
+                return
+        self._set_stacked(np.stack(vals), tuple(self.keys()))
+
+    def _set_stacked(self, stacked, keys):
+        views = tuple(stacked[idx, ...] for idx in range(len(keys)))
+        for key, view in zip(keys, views):
+            self._contents[key] = view
+        self._stacked = (stacked, keys, views)
+
+    def _get_stacked(self):
+        # Contents can be changed without the arraytainer knowing (e.g. through the contents property), so
+        # check that contents still only holds views of the stacked array each time it's used:
+        if self._stacked is not None:
+            _, keys, views = self._stacked
+            if tuple(self.keys()) != keys or not all(self._contents[key] is view for key, view in zip(keys, views)):
+                self._stacked = None
+        return self._stacked
+
+    @classmethod
+    def _from_stacked(cls, stacked, keys, contents_type):
+        contents = dict.fromkeys(keys) if contents_type is dict else [None]*len(keys)
+        arraytainer = cls._from_canonical(contents)
+        arraytainer._set_stacked(stacked, keys)
+        return arraytainer
+
+    @staticmethod
+    def _stacked_index(array_key):
+        # Applies array_key to each view of the stacked array:
+        return (slice(None), *array_key) if type(array_key) is tuple else (slice(None), array_key)
+
+    def _is_stacked_scalar(self, val):
+        # Scalars are broadcast the same way against stacked arrays as against the individual arrays:
+        return isinstance(val, self._stacked_scalar_types) or (isinstance(val, np.ndarray) and val.ndim == 0)
+
+    def _call_ufunc_on_stacked(self, ufunc, args):
+
+        stacked_args = []
+        keys = contents_type = ndim = None
+        has_scalar = False
+        for arg in args:
+            if isinstance(arg, Arraytainer):
+                stacked = arg._get_stacked()
+                if stacked is None:
+                    return None
+                stacked_array, arg_keys, _ = stacked
+                if keys is None:
+                    keys, contents_type, ndim = arg_keys, arg._type, stacked_array.ndim
+                # Arrays of different dimensions would be broadcast differently when stacked:
+                elif arg_keys != keys or arg._type is not contents_type or stacked_array.ndim != ndim:
+                    return None
+                stacked_args.append(stacked_array)
+            elif self._is_stacked_scalar(arg):
+                stacked_args.append(arg)
+                has_scalar = True
+            else:
+                return None
+
+        # Older versions of Numpy promote scalars differently when combined with zero-dimensional arrays
+        # than with the (one-dimensional) stacked array, which could change the dtype of the result:
+        if has_scalar and ndim == 1:
+            return None
+
+        return self._from_stacked(ufunc(*stacked_args), keys, contents_type)
+
+    #
+    #   Copying Methods
+    #
+
+    # Much faster than copy.deepcopy, which goes through the pickling machinery for every array:
+    def _deepcopy_contents(self, contents):
+        if isinstance(contents, np.ndarray):
+            return contents.copy()
+        elif isinstance(contents, dict):
+            return {key: self._deepcopy_contents(val) for key, val in contents.items()}
+        elif isinstance(contents, list):
+            return [self._deepcopy_contents(val) for val in contents]
+        elif isinstance(contents, tuple):
+            return tuple(self._deepcopy_contents(val) for val in contents)
+        elif isinstance(contents, Arraytainer):
+            return contents.copy()
+        else:
+            return copy.deepcopy(contents)
+
+    def __copy__(self):
+        # Stacked arrays can be copied in one go, rather than copying each of their views:
+        stacked = self._get_stacked()
+        if stacked is not None:
+            stacked_array, keys, _ = stacked
+            return self._from_stacked(stacked_array.copy(), keys, self._type)
+        return super().__copy__()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Views of a stacked array are unpickled as separate arrays, so need to be stacked again:
+        if self._can_store_stacked:
+            self._store_stacked_if_possible()
 
     #
     #   Array Conversion Methods
@@ -106,8 +247,9 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
 
     @staticmethod
     def _convert_to_array(val):
-        # Note that Jaxtainer uses jnp.array:
-        return np.array(val)
+        # Note that Jaxtainer uses jnp.array; asarray avoids copying arrays, since 
+        # contents are copied anyway when the arraytainer is constructed:
+        return np.asarray(val)
 
     def _convert_contents_to_arrays(self, contents, greedy):
 
@@ -118,6 +260,12 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
         contents_iter = contents.items() if isinstance(contents, dict) else enumerate(contents)
 
         for key, val in contents_iter:
+
+            # Most values will already be arrays, so deal with them before checking for containers:
+            if isinstance(val, self._arrays):
+                contents[key] = self._convert_to_array(val)
+                continue
+
             val = self._unpack_if_arraytainer(val)
 
             if isinstance(val, dict):
@@ -173,13 +321,28 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
     #
 
     def __getitem__(self, key):
-        if isinstance(key, self._arrays) or self._is_slice(key):
+        key_type = type(key)
+        # Most keys are strings or ints, so check for these first using quick type comparisons:
+        if key_type is str or key_type is int:
+            item = self._get_with_hash(key)
+        elif key_type is slice or key is None or isinstance(key, self._arrays) or \
+             (key_type is tuple and self._is_slice(key)):
             item = self._get_with_array(key)
         else:
             item = super().__getitem__(key, greedy=True)
         return item
     
     def _get_with_array(self, array_key):
+        
+        stacked = self._get_stacked()
+        if stacked is not None:
+            stacked_array, keys, _ = stacked
+            item = stacked_array[self._stacked_index(array_key)]
+            # Slicing returns a view, but indexed arraytainers shouldn't share arrays with the original:
+            if np.may_share_memory(item, stacked_array):
+                item = item.copy()
+            return self._from_stacked(item, keys, self._type)
+
         item = {key: self._contents[key][array_key] for key in self.keys()}
         if self._type is list:
             item = list(item.values())
@@ -198,15 +361,20 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
         super().assign(new_val, *key_iterable)
 
     def _convert_to_array_or_arraytainer(self, val):
+        # Arrays are the most common values, so check for them before the (slower) Number check:
+        if isinstance(val, self._arrays):
+            return val
         if isinstance(val, numbers.Number):
-            val = self._convert_to_array(val)
-        if not isinstance(val, self._arrays):
-            val = self.__class__(val)
-        return val
+            return self._convert_to_array(val)
+        return self.__class__(val)
 
     def __setitem__(self, key, new_value):
-        if isinstance(key, self._arrays) or self._is_slice(key):
-            self._set_with_array(key)
+        key_type = type(key)
+        if key_type is str or key_type is int:
+            super().__setitem__(key, new_value)
+        elif key_type is slice or key is None or isinstance(key, self._arrays) or \
+             (key_type is tuple and self._is_slice(key)):
+            self._set_with_array(key, new_value)
         elif isinstance(key, Arraytainer):
             self._set_with_arraytainer(key, new_value)
         else:
@@ -214,18 +382,23 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
 
     @staticmethod
     def _is_slice(val):
-        if isinstance(val, slice):
+        if type(val) is slice or val is None:
             is_slice = True
         # Slices accross multiple dimensions appear as tuples of ints/slices/Nones (e.g. my_array[3, 1:2, :])
         elif isinstance(val, tuple) and all(isinstance(val_i, (type(None), slice, int)) for val_i in val):
             is_slice = True
-        elif val is None:
-            is_slice = True
         else:
             is_slice = False
         return is_slice
 
     def _set_with_array(self, array_key, new_value):
+
+        # Arrays (unlike scalars) could be broadcast against stacked array differently to its views:
+        stacked = self._get_stacked()
+        if stacked is not None and self._is_stacked_scalar(new_value):
+            stacked[0][self._stacked_index(array_key)] = new_value
+            return
+
         for key in self.keys():
             value_i = new_value[key] if isinstance(new_value, Arraytainer) else new_value
             # Note that Jaxtainers use different _set_array_values method:
@@ -235,6 +408,16 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
         self._contents[key][idx] = new_value
 
     def _set_with_arraytainer(self, arraytainer_key, new_value):
+
+        # Boolean masks of the same shape as the stacked array pick out the same elements as the masks of each view:
+        stacked, key_stacked = self._get_stacked(), arraytainer_key._get_stacked()
+        if stacked is not None and key_stacked is not None and self._is_stacked_scalar(new_value):
+            stacked_array, keys, _ = stacked
+            mask, mask_keys, _ = key_stacked
+            if mask_keys == keys and mask.dtype == bool and mask.shape == stacked_array.shape:
+                stacked_array[mask] = new_value
+                return
+
         for key, val in arraytainer_key.items():
             new_value_i = new_value[key] if isinstance(new_value, Arraytainer) else new_value
             if isinstance(val, self._arrays):
@@ -251,40 +434,52 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
         return np.transpose(self)
     
     def all(self):
-        for key in self.keys():
-            # Numpy/Jax arrays also have an 'all' method:
-            if not self.contents[key].all():
-                return False
-        return True
+        stacked = self._get_stacked()
+        if stacked is not None:
+            return bool(stacked[0].all())
+        vals = self._contents.values() if self._type is dict else self._contents
+        # Numpy/Jax arrays also have an 'all' method; builtin all stops at first False value:
+        return all(val.all() for val in vals)
 
     def any(self):
-        for key in self.keys():
-            if self.contents[key].any():
-                return True
-        return False
+        stacked = self._get_stacked()
+        if stacked is not None:
+            return bool(stacked[0].any())
+        vals = self._contents.values() if self._type is dict else self._contents
+        return any(val.any() for val in vals)
 
     def sum(self):
         return sum(self.values())
 
     def sum_arrays(self):
-        return sum(self.list_elements())
+        arrays = self.list_elements()
+        # Summing over a single stacked array avoids creating a temporary array for every addition:
+        if arrays and self._all_elems_are_arrays(arrays) and self._all_arrays_of_equal_shape(arrays) \
+           and self._all_arrays_of_equal_numeric_dtype(arrays):
+            stacked = self._stack_arrays(arrays)
+            # Explicitly specify dtype, since sum promotes small integer types:
+            return stacked.sum(axis=0, dtype=stacked.dtype)
+        return sum(arrays)
+
+    @staticmethod
+    def _all_arrays_of_equal_numeric_dtype(arrays):
+        # Boolean arrays excluded, since summing them with + gives integers:
+        first_dtype = arrays[0].dtype
+        return np.issubdtype(first_dtype, np.number) and all(array_i.dtype == first_dtype for array_i in arrays)
+
+    @staticmethod
+    def _stack_arrays(arrays):
+        # Jaxtainer version of this method uses jnp methods instead of np:
+        return np.stack(arrays)
 
     def sum_all(self):
         arraytainer_of_scalars = np.sum(self)
         return sum(arraytainer_of_scalars.list_elements())
 
     def get_shape(self, return_tuples=False):
-        
-        shapes = {}
-        for key, val in self.items():
-            shapes[key] = val.shape
-        
-        if self._type is list:
-            shapes = list(shapes.values())
-
+        shapes = self._unpack_and_apply(lambda val: val.shape)
         if not return_tuples:
             shapes = self.__class__(shapes, greedy=True)
-
         return shapes
 
     #
@@ -301,28 +496,36 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
 
     @property
     def sizes(self):
-        return np.prod(self.shape)
+        sizes = self._unpack_and_apply(lambda val: self._convert_to_array(val.size))
+        return self.__class__(sizes, greedy=True)
 
     @property
     def size(self):
-        size = self.sizes.sum_all()
-        if isinstance(size, self._arrays):
-            size = size.item()
-        return size
+        return sum(array.size for array in self.list_elements())
 
     def reshape(self, *new_shapes, order='C'):
         new_shapes = self._concatenate_elements_to_array(new_shapes)
         return np.reshape(self, new_shapes, order=order)
 
     def flatten(self, order='C', return_array=True):
-        output = np.squeeze(np.ravel(self, order=order))
-        if return_array:
-            # Zero-dimensional elements cause concatenate to throw error:
-            elem_list = output.list_elements()
-            for idx, elem in enumerate(elem_list):
-                if elem.ndim == 0:
-                    elem_list[idx] = elem[None]
-            output = np.concatenate(elem_list)
+        
+        if not return_array:
+            return np.squeeze(np.ravel(self, order=order))
+        
+        arrays = self.list_elements()
+        # Same error as concatenating an empty list of arrays:
+        if not arrays:
+            raise ValueError('Unable to flatten an arraytainer which contains no arrays.')
+
+        # Copy arrays straight into output vector, rather than concatenating a list of raveled arrays:
+        dtype = functools.reduce(np.promote_types, [array.dtype for array in arrays])
+        output = np.empty(self.size, dtype=dtype)
+        start_idx = 0
+        for array in arrays:
+            end_idx = start_idx + array.size
+            output[start_idx:end_idx] = np.ravel(array, order=order)
+            start_idx = end_idx
+
         return output
 
     #
@@ -334,6 +537,11 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
         return fun_return
 
     def __array_ufunc__(self, ufunc, method, *args, **kwargs):
+        # Generalised ufuncs (e.g. matmul) could treat the stacking dimension as one of their core dimensions:
+        if method == '__call__' and not kwargs and ufunc.nout == 1 and ufunc.signature is None:
+            fun_return = self._call_ufunc_on_stacked(ufunc, args)
+            if fun_return is not None:
+                return fun_return
         fun_return = self._manage_func_call(ufunc, method, *args, **kwargs)
         return fun_return
 
@@ -341,28 +549,35 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
 
         arraytainer_list = self._list_arraytainers_in_args(args) + self._list_arraytainers_in_args(kwargs)
         largest_arraytainer = self._find_largest_arraytainer(arraytainer_list)
-        self._check_arraytainer_arg_compatability(arraytainer_list, largest_arraytainer)
-        shared_keyset = self._get_shared_keyset(arraytainer_list)
-
-        func_return = copy.deepcopy(largest_arraytainer.contents)
+        # Keysets are used both to check compatability and to find shared keys, so only build them once:
+        keysets = [arraytainer._keyset for arraytainer in arraytainer_list]
+        self._check_arraytainer_arg_compatability(arraytainer_list, keysets, largest_arraytainer)
+        shared_keyset = self._get_shared_keyset(keysets)
+
+        # Only need a container with the right keys - values of shared keys are all overwritten, and
+        # the arraytainer constructor copies whatever values remain:
+        func_return = largest_arraytainer._contents.copy()
         for key in shared_keyset:
-            args_i = self._prepare_func_args(args, key)
-            kwargs_i = self._prepare_func_args(kwargs, key)
+            args_i = self._prepare_pos_args(args, key)
+            kwargs_i = self._prepare_kw_args(kwargs, key)
             func_return[key] = func(*args_i, **kwargs_i)
 
         return self.__class__(func_return, greedy=True)
 
     @staticmethod
     def _list_arraytainers_in_args(args):
-        args_iter = args.values() if isinstance(args, dict) else args
         args_arraytainers = []
-        for arg_i in args_iter:
+        to_search = [args]
+        while to_search:
+            arg_i = to_search.pop()
             if isinstance(arg_i, Arraytainer):
                 args_arraytainers.append(arg_i)
-            # Could have an arraytainer in a list in a tuple (e.g. np.concatenate):
-            elif isinstance(arg_i, (list, tuple, dict)):
-                args_arraytainers += Arraytainer._list_arraytainers_in_args(arg_i)
-        
+            # Could have an arraytainer in a list in a tuple (e.g. np.concatenate) - items are added in reverse
+            # so that they're popped off in order, since the first arraytainer sets the key order of the output:
+            elif isinstance(arg_i, dict):
+                to_search.extend(reversed(list(arg_i.values())))
+            elif isinstance(arg_i, (list, tuple)):
+                to_search.extend(reversed(arg_i))
         return args_arraytainers
 
     @staticmethod
@@ -374,44 +589,54 @@ class Arraytainer(Contents, np.lib.mixins.NDArrayOperatorsMixin):
                 largest_arraytainer = arraytainer
         return largest_arraytainer
 
-    def _check_arraytainer_arg_compatability(self, arraytainer_list, largest_arraytainer):
+    def _check_arraytainer_arg_compatability(self, arraytainer_list, keysets, largest_arraytainer):
 
-        largest_keyset = set(largest_arraytainer.keys())
+        # Largest arraytainer is the first with the most keys, which max also picks out:
+        largest_keyset = max(keysets, key=len)
             
-        for arraytainer_i in arraytainer_list:
+        for arraytainer_i, ith_keyset in zip(arraytainer_list, keysets):
             
             if arraytainer_i._type != largest_arraytainer._type:
                 raise KeyError('Arraytainers being combined through operations must'
                                'be all dictionary-like or all list-like')
             
-            ith_keyset = set(arraytainer_i.keys())
             if not ith_keyset.issubset(largest_keyset):
-                raise KeyError(f'Keys of an Arraytainer (= {ith_keyset}) is not a subset of the '
-                               f"keys of a larger Arraytainer (={largest_keyset}) it's being combined with.")
+                raise KeyError(f'Keys of an Arraytainer (= {set(ith_keyset)}) is not a subset of the '
+                               f"keys of a larger Arraytainer (={set(largest_keyset)}) it's being combined with.")
     
     @staticmethod
-    def _get_shared_keyset(arraytainer_list):
-        return set.intersection(*[set(arraytainer.keys()) for arraytainer in arraytainer_list])
+    def _get_shared_keyset(keysets):
+        return frozenset.intersection(*keysets)
 
 
     @staticmethod
-    def _prepare_func_args(args, key):
-        
-        args_iter = args.items() if isinstance(args, dict) else enumerate(args)
-        
-        prepped_args = {}
-        for arg_key, arg in args_iter:
+    def _prepare_pos_args(args, key):
+        prepped_args = []
+        for arg in args:
             if isinstance(arg, Arraytainer):
                 # Skip over this arg if doesn't include key:
-                if key in arg.keys():
-                    prepped_args[arg_key]  = arg[key]
+                if arg._has_key(key):
+                    prepped_args.append(arg._contents[key])
             # Tuple args may contain arryatainer entries:
-            elif isinstance(arg, (tuple, list, dict)):
-                prepped_args[arg_key] = Arraytainer._prepare_func_args(arg, key)
+            elif isinstance(arg, (tuple, list)):
+                prepped_args.append(Arraytainer._prepare_pos_args(arg, key))
+            elif isinstance(arg, dict):
+                prepped_args.append(Arraytainer._prepare_kw_args(arg, key))
             else:
-                prepped_args[arg_key] = arg
+                prepped_args.append(arg)
+        return tuple(prepped_args)
 
-        if not isinstance(args, dict):
-            prepped_args = tuple(prepped_args.values())
-
-        return prepped_args
\ No newline at end of file
+    @staticmethod
+    def _prepare_kw_args(kwargs, key):
+        prepped_kwargs = {}
+        for arg_key, arg in kwargs.items():
+            if isinstance(arg, Arraytainer):
+                if arg._has_key(key):
+                    prepped_kwargs[arg_key] = arg._contents[key]
+            elif isinstance(arg, (tuple, list)):
+                prepped_kwargs[arg_key] = Arraytainer._prepare_pos_args(arg, key)
+            elif isinstance(arg, dict):
+                prepped_kwargs[arg_key] = Arraytainer._prepare_kw_args(arg, key)
+            else:
+                prepped_kwargs[arg_key] = arg
+        return prepped_kwargs
\ No newline at end of file
@@ -8,7 +8,10 @@ from jax.tree_util import register_pytree_node_class
 @register_pytree_node_class
 class Jaxtainer(Arraytainer):
 
+    __slots__ = ()
+
     _arrays = (np.ndarray, jnp.DeviceArray)
+    _can_store_stacked = False
 
     def __init__(self, contents, convert_arrays=True, greedy=False, nested=True):
         super().__init__(contents, convert_arrays, greedy, nested)
@@ -32,24 +35,34 @@ class Jaxtainer(Arraytainer):
                 copied_contents[key] = self._convert_to_array(val)
             elif isinstance(val, (list, dict, tuple)):
                 copied_contents[key] = self._deepcopy_contents(val)
+            elif isinstance(val, Arraytainer):
+                copied_contents[key] = val.copy()
             else:
                 copied_contents[key] = copy.deepcopy(val)
 
         return copied_contents
 
     def _set_array_values(self, key, idx, value):
-        self._contents[key] = self.contents[key].at[idx].set(value)
+        self._contents[key] = self._contents[key].at[idx].set(value)
 
     @staticmethod
     def _convert_to_array(val):
         return jnp.array(val)
 
     @staticmethod
-    def _extract_array_vals(vector, elem_idx, shape):
-        num_elem = jnp.prod(shape)
-        array_vals = vector[elem_idx:elem_idx+num_elem]
-        elem_idx += num_elem
-        return array_vals, elem_idx
+    def _split_vector(vector, split_idxs):
+        return jnp.split(vector, split_idxs)
+
+    @staticmethod
+    def _stack_arrays(arrays):
+        return jnp.stack(arrays)
+
+    def flatten(self, order='C', return_array=True):
+        if not return_array:
+            return super().flatten(order, return_array)
+        # Jax arrays can't be filled in place, so must concatenate them instead:
+        arrays = [jnp.ravel(array, order=order) for array in self.list_elements()]
+        return jnp.concatenate(arrays)
 
     #
     #   Numpy Function Handling Methods (Overrides Arraytainer methods)
@@ -61,14 +74,18 @@ class Jaxtainer(Arraytainer):
 
         arraytainer_list = self._list_arraytainers_in_args(args) + self._list_arraytainers_in_args(kwargs)
         largest_arraytainer = self._find_largest_arraytainer(arraytainer_list)
-        self._check_arraytainer_arg_compatability(arraytainer_list, largest_arraytainer)
-        shared_keyset = self._get_shared_keyset(arraytainer_list)
-
-        func_return = copy.deepcopy(largest_arraytainer.contents)
+        # Keysets are used both to check compatability and to find shared keys, so only build them once:
+        keysets = [arraytainer._keyset for arraytainer in arraytainer_list]
+        self._check_arraytainer_arg_compatability(arraytainer_list, keysets, largest_arraytainer)
+        shared_keyset = self._get_shared_keyset(keysets)
+
+        # Only need a container with the right keys - values of shared keys are all overwritten, and
+        # the arraytainer constructor copies whatever values remain:
+        func_return = largest_arraytainer._contents.copy()
         for key in shared_keyset:
             
-            args_i = self._prepare_func_args(args, key)
-            kwargs_i = self._prepare_func_args(kwargs, key)
+            args_i = self._prepare_pos_args(args, key)
+            kwargs_i = self._prepare_kw_args(kwargs, key)
             arraytainer_list_i = self._list_arraytainers_in_args(args_i) + self._list_arraytainers_in_args(kwargs_i)
 
             # Need to call Numpy method for recursion on Arraytainer arguments:
@@ -77,12 +94,11 @@ class Jaxtainer(Arraytainer):
 
         return self.__class__(func_return, greedy=True)
         
-    def _prepare_func_args(self, args, key):
-        prepped_args = super()._prepare_func_args(args, key)
+    def _prepare_kw_args(self, kwargs, key):
+        prepped_kwargs = super()._prepare_kw_args(kwargs, key)
         # Jax methods don't use 'out' keyword in kwargs:
-        if isinstance(prepped_args, dict):
-            prepped_args.pop('out', None)
-        return prepped_args
+        prepped_kwargs.pop('out', None)
+        return prepped_kwargs
 
     _jnp_submodules_to_search = ('', 'linalg', 'fft')
     def _find_jnp_method(self, func):
@@ -13,6 +13,7 @@ STD_SHAPES = {
 'single_elements': [ [{'a':(1,2), 'b':[(2,3)]}], {'a':[{'b':[(3,2)]}]} ],
 'simple_dicts': [ {'a':(1,),'b':(2,),'c':(3,)}, {'a':(2,2),'b':(3,2)}],
 'simple_lists': [ [(1,),(2,2),(3,3,3)], [(1,2),(3,2)] ],
+'equal_shapes': [ {'a':(2,3),'b':(2,3),'c':(2,3)}, [(3,),(3,)] ],
 # 'dicts_with_strange_keys': [ {'a':(3,2), 1:(2,3), 1.5:(2,1), ('a',1): (1,)} ],
 'nested_lists': [ [[(2,1)], [(2,1)]], [[(2,3,2), (3,), [(2,), (3,2,1)]], (1,)] ],
 'nested_dicts': [ {'a':{'a':(2,3), 'b':(3,), 'c':{'a':(2,), 'b':(3,)}},'b':(1,)} ],
@@ -43,6 +43,19 @@ class ArrayMixin:
             except ValueError as exception:
                 self.assert_exception(lambda x: x.flatten(order=order), exception, arraytainer)
 
+    ZERO_DIM_SHAPES = {'list': [(), (2,), ()], 
+                       'dict': {'a':(), 'b':{'c':(2,2), 'd':()}},
+                       'mixed': [{'a':()}, [(), (3,1)]]}
+    @pytest.mark.parametrize('contents', ZERO_DIM_SHAPES.values(), ids=ZERO_DIM_SHAPES.keys(), indirect=['contents'])
+    def test_from_array_with_zero_dimensional_shapes(self, contents):
+        arraytainer = self.container_class(contents)
+        vector = arraytainer.flatten()
+        for shapes in (arraytainer.shape, self.container_class(arraytainer.get_shape(return_tuples=True), greedy=True)):
+            result = self.container_class.from_array(vector, shapes)
+            utils.assert_equal_values(result.unpacked, contents)
+            utils.assert_same_types(result, arraytainer)
+            assert result.get_shape(return_tuples=True) == arraytainer.get_shape(return_tuples=True)
+
     def test_arraytainer_composition(self, std_contents):
         arraytainer = self.container_class(std_contents, greedy=True)
         arraytainer_2 = self.container_class(arraytainer, greedy=True)
@@ -59,6 +72,7 @@ class ArrayMixin:
     def test_shape_methods(self, std_contents_and_shapes):
 
         in_contents, shapes = std_contents_and_shapes
+        shape_tuples = deepcopy(shapes)
 
         arraytainer = self.container_class(in_contents, greedy=True)
 
@@ -68,6 +82,37 @@ class ArrayMixin:
         utils.assert_equal_values(result.unpacked, expected.unpacked)
         utils.assert_same_types(expected, result)
 
+        # Shapes can also be returned as nested dicts and lists of tuples:
+        assert arraytainer.get_shape(return_tuples=True) == shape_tuples
+
+    def test_size_methods(self, std_contents):
+
+        arraytainer = self.container_class(std_contents)
+        array_list = utils.get_list_of_arrays(std_contents)
+
+        # Total size should be a Python int, even for empty arraytainers:
+        result = arraytainer.size
+        assert type(result) is int
+        assert result == sum(x.size for x in array_list)
+
+        sizes = arraytainer.sizes.list_elements()
+        assert [int(x) for x in sizes] == [x.size for x in array_list]
+        assert all(np.issubdtype(x.dtype, np.integer) for x in sizes)
+
+    def test_size_methods_with_zero_dimensional_arrays(self):
+
+        contents = {'a': self.array_constructor(1.5), 'b': [self.array_constructor(2.), self.array_constructor([1.,2.])]}
+        arraytainer = self.container_class(contents)
+
+        result = arraytainer.size
+        assert type(result) is int
+        assert result == 4
+
+        # Zero-dimensional arrays have an integer size of 1:
+        sizes = arraytainer.sizes
+        utils.assert_equal_values(sizes.unpacked, {'a': np.array(1), 'b': [np.array(1), np.array(2)]})
+        assert all(np.issubdtype(x.dtype, np.integer) for x in sizes.list_elements())
+
     def test_transpose(self, std_contents):
         arraytainer = self.container_class(std_contents)
         transpose_func = lambda x : x.T
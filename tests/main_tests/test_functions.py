@@ -1,5 +1,6 @@
 import pytest
 import numpy as np
+from copy import deepcopy
 from numbers import Number
 from . import utils
 from .utils import cartesian_prod
@@ -41,6 +42,32 @@ class FunctionMixin:
         for func_i in (lambda x: ufunc(x, scalar), lambda x: ufunc(scalar, x)):
             self.perform_function_test(std_contents, func=func_i)
 
+    ZERO_DIM_CONTENTS = {'dict': {'a': 1, 'b': 2, 'c': 3}, 'list': [1, 2]}
+    @pytest.mark.parametrize('ufunc', UFUNC_TEST_CASES.values(), ids=UFUNC_TEST_CASES.keys())
+    @pytest.mark.parametrize('scalar', [2, 1.5], ids=['int', 'float'])
+    @pytest.mark.parametrize('values', ZERO_DIM_CONTENTS.values(), ids=ZERO_DIM_CONTENTS.keys())
+    def test_ufunc_scalar_with_zero_dimensional_arrays(self, values, scalar, ufunc):
+        # Result dtypes should match those found by applying ufunc to each zero-dimensional array:
+        keys = utils.get_keys(values)
+        contents = deepcopy(values)
+        for key in keys:
+            contents[key] = self.array_constructor(np.array(values[key], dtype=np.float32))
+        arraytainer = self.container_class(contents)
+        for func_i in (lambda x: ufunc(x, scalar), lambda x: ufunc(scalar, x)):
+            result = func_i(arraytainer)
+            for key in keys:
+                expected = func_i(contents[key])
+                assert result[key].dtype == expected.dtype
+                assert np.allclose(result[key], expected)
+
+    KEY_ORDER_FUNCS = {'addition': lambda x,y: x+y, 'concatenate': lambda x,y: np.concatenate([x,y])}
+    @pytest.mark.parametrize('func', KEY_ORDER_FUNCS.values(), ids=KEY_ORDER_FUNCS.keys())
+    def test_result_keys_follow_first_arraytainer(self, func):
+        x = self.container_class({'a': self.array_constructor(np.ones((2,))), 'b': self.array_constructor(np.ones((3,)))})
+        y = self.container_class({'b': self.array_constructor(np.ones((3,))), 'a': self.array_constructor(np.ones((2,)))})
+        assert list(func(x, y).keys()) == ['a', 'b']
+        assert list(func(y, x).keys()) == ['b', 'a']
+
     ARRAY_EXCEPTION_TESTS = ( ([2],None), ([2,2],None), ([[2]],None), ([[2, 2]],None), ([2,2,1],ValueError) )
     UFUNC_ARRAY_TEST_CASES = \
     {'list': cartesian_prod( [[(2,2),(1,2)],[(1,2),(2,2)]], ARRAY_EXCEPTION_TESTS ),
@@ -100,7 +127,10 @@ class FunctionMixin:
                         (  ( [(3,2),(2,1)], None ),
                            ( [{'a':(3,1),'b':(3,2)},{'a':(2,1),'b':(2,2)}], None ),
                            ( [{'a':[(3,1),(3,2)],'b':[(3,2),(3,1)]},{'a':[(2,1),(2,2)],'b':[(2,2),(2,1)]}], None ),
-                           ( [(2,2),(2,1)], 'broadcast_error' ) ) ) 
+                           ( [(2,2),(2,1)], 'broadcast_error' ) ) ),
+     'vectors': cartesian_prod( {'a':(3,),'b':(3,),'c':(3,)},
+                        (  ( {'a':(3,),'b':(3,),'c':(3,)}, None ),
+                           ( [(3,),(3,)], 'key_error' ) ) ) 
     }   
     MATMULT_TEST_CASES = utils.group_first_n_params(MATMULT_TEST_CASES, n=2)
     @pytest.mark.parametrize('contents_list, exception', utils.unpack_test_cases(MATMULT_TEST_CASES), 
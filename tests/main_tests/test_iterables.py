@@ -15,6 +15,21 @@ class IterableMixin:
         else:
             self.assert_exception(self.container_class, exception, contents)
 
+    SET_KEY_CHECKING_TEST_CASES = \
+    {'tuple_of_strs': (('a','b'), 'key'),
+     'tuple_of_str_and_int': (('1',2), 'key'),
+     'valid_key': ('b', None)}
+    @pytest.mark.parametrize('key, exception', SET_KEY_CHECKING_TEST_CASES.values(), ids=SET_KEY_CHECKING_TEST_CASES.keys())
+    def test_key_checking_when_setting(self, key, exception):
+        arraytainer = self.container_class({'a': self.array_constructor([1.,2.])})
+        set_func = lambda arraytainer, key: arraytainer.__setitem__(key, self.array_constructor([3.]))
+        if exception is None:
+            set_func(arraytainer, key)
+            assert key in arraytainer.keys()
+        else:
+            self.assert_exception(set_func, exception, arraytainer, key)
+            assert key not in arraytainer.keys()
+
     def test_unpacking(self, std_contents):
         arraytainer = self.container_class(std_contents)
         utils.assert_equal_values(arraytainer.unpacked, std_contents)
@@ -1,5 +1,6 @@
     
 import pytest
+import pickle
 import operator
 import numpy as np
 from copy import deepcopy
@@ -31,6 +32,141 @@ class SetMixin:
         # stored in the arraytainer should be independent of the initial contents used to create it
         utils.set_contents_item(contents_copy, key_iterable, new_val)
         utils.assert_equal_values(arraytainer.unpacked, contents)
+
+    COPY_FUNCS = {'copy': lambda x: x.copy(), 'deepcopy': lambda x: x.deepcopy(), 'copy_module': deepcopy}
+    @pytest.mark.parametrize('copy_func', COPY_FUNCS.values(), ids=COPY_FUNCS.keys())
+    def test_copy_independence(self, std_contents, copy_func):
+        arraytainer = self.container_class(std_contents)
+        arraytainer_copy = copy_func(arraytainer)
+        utils.assert_equal_values(arraytainer_copy.unpacked, std_contents)
+        utils.assert_same_types(arraytainer_copy, arraytainer)
+        # Changing the copy should leave the original arraytainer unchanged:
+        arraytainer_copy[:] = -1
+        utils.assert_equal_values(arraytainer.unpacked, std_contents)
+
+    def test_set_all_with_slice(self, std_contents):
+        arraytainer = self.container_class(std_contents)
+        arraytainer[:] = 0
+        expected, _ = utils.apply_func_to_contents(std_contents, func=lambda x: np.zeros(x.shape), throw_exception=True)
+        utils.assert_equal_values(arraytainer.unpacked, expected)
+        utils.assert_same_types(arraytainer, self.container_class(std_contents))
+
+    SET_WITH_ARRAY_SHAPES = {'stacked_dict': {'a':(2,3),'b':(2,3),'c':(2,3)},
+                             'stacked_list': [(2,3),(2,3)],
+                             'unstacked': {'a':(2,3),'b':(2,4)},
+                             'nested': {'a':(2,3),'b':{'c':(2,3),'d':(2,3)}}}
+    SET_WITH_ARRAY_KEYS = {'slice': np.s_[:1], 'tuple': np.s_[0,1:], 'bool_array': np.array([True, False])}
+    SET_WITH_ARRAYTAINER_MASKS = {'elementwise': lambda x: x > 5, 'rows': lambda x: x[:,0] > 5}
+    SET_VALUE_TYPES = ('scalar', 'zero_dim_array', 'array', 'arraytainer')
+
+    def create_set_value(self, contents, value_type):
+        # Returns value to set arraytainer with, along with its unpacked form:
+        if value_type == 'scalar':
+            return -1., -1.
+        elif value_type == 'zero_dim_array':
+            return self.array_constructor(-2.), np.array(-2.)
+        elif value_type == 'array':
+            return self.array_constructor([5.]), np.array([5.])
+        else:
+            # Set each top-level key to a different value:
+            value_contents = {key: float(i) for i, key in enumerate(utils.get_keys(contents))}
+            if isinstance(contents, list):
+                value_contents = list(value_contents.values())
+            return self.container_class(value_contents), value_contents
+
+    @staticmethod
+    def set_array_values(array, value, key):
+        array = np.array(array)
+        array[key] = value
+        return array
+
+    @pytest.mark.parametrize('contents', SET_WITH_ARRAY_SHAPES.values(), ids=SET_WITH_ARRAY_SHAPES.keys(), indirect=['contents'])
+    @pytest.mark.parametrize('key', SET_WITH_ARRAY_KEYS.values(), ids=SET_WITH_ARRAY_KEYS.keys())
+    @pytest.mark.parametrize('value_type', SET_VALUE_TYPES)
+    def test_set_with_array(self, contents, key, value_type):
+
+        arraytainer = self.container_class(contents)
+        new_val, unpacked_val = self.create_set_value(contents, value_type)
+        expected, _ = utils.apply_func_to_contents(contents, unpacked_val, func=self.set_array_values, args=(key,),
+                                                   throw_exception=True)
+
+        arraytainer[key] = new_val
+        utils.assert_equal_values(arraytainer.unpacked, expected)
+        utils.assert_same_types(arraytainer, self.container_class(expected))
+        # Set values should also be used by functions called on arraytainer:
+        expected, _ = utils.apply_func_to_contents(expected, func=lambda x: x + 1, throw_exception=True)
+        utils.assert_equal_values((arraytainer + 1).unpacked, expected)
+
+    @pytest.mark.parametrize('contents', SET_WITH_ARRAY_SHAPES.values(), ids=SET_WITH_ARRAY_SHAPES.keys(), indirect=['contents'])
+    @pytest.mark.parametrize('mask_func', SET_WITH_ARRAYTAINER_MASKS.values(), ids=SET_WITH_ARRAYTAINER_MASKS.keys())
+    @pytest.mark.parametrize('value_type', SET_VALUE_TYPES)
+    def test_set_with_arraytainer(self, contents, mask_func, value_type):
+
+        arraytainer = self.container_class(contents)
+        mask_contents, _ = utils.apply_func_to_contents(contents, func=lambda x: mask_func(np.array(x)), throw_exception=True)
+        mask = self.container_class(mask_contents)
+        new_val, unpacked_val = self.create_set_value(contents, value_type)
+        set_func = lambda array, mask, value: self.set_array_values(array, value, mask)
+        expected, _ = utils.apply_func_to_contents(contents, mask_contents, unpacked_val, func=set_func, throw_exception=True)
+
+        arraytainer[mask] = new_val
+        utils.assert_equal_values(arraytainer.unpacked, expected)
+        utils.assert_same_types(arraytainer, self.container_class(expected))
+        expected, _ = utils.apply_func_to_contents(expected, func=lambda x: x + 1, throw_exception=True)
+        utils.assert_equal_values((arraytainer + 1).unpacked, expected)
+
+    def test_setting_after_pickling(self, std_contents):
+        
+        arraytainer = pickle.loads(pickle.dumps(self.container_class(std_contents)))
+        utils.assert_equal_values(arraytainer.unpacked, std_contents)
+        utils.assert_same_types(arraytainer, self.container_class(std_contents))
+
+        # Arrays changed in place after unpickling should be seen by all arraytainer methods:
+        array_list = arraytainer.list_elements()
+        if not all(isinstance(x, np.ndarray) and x.flags.writeable for x in array_list):
+            pytest.skip(f'Arrays in {self.container_class.__name__} cannot be changed in place.')
+        for array in array_list:
+            array[...] = 0
+        expected, _ = utils.apply_func_to_contents(arraytainer.unpacked, func=lambda x: x + 1, throw_exception=True)
+        utils.assert_equal_values((arraytainer + 1).unpacked, expected)
+        assert not arraytainer.any()
+
+    # Mutation functions are passed the arraytainer, the contents dict it returned before being used, and a new value:
+    MUTATION_FUNCS = (lambda x, held_contents, new_val: x.__setitem__('b', new_val),
+                      lambda x, held_contents, new_val: x.assign(new_val, 'b'),
+                      lambda x, held_contents, new_val: held_contents.__setitem__('b', new_val),
+                      lambda x, held_contents, new_val: x.__setitem__(np.s_[:1], -1.),
+                      lambda x, held_contents, new_val: x.__setitem__(x > 5, -1.))
+    NESTED_MUTATION_FUNCS = (lambda x, held_contents, new_val: x['c'].__setitem__('d', new_val),
+                             lambda x, held_contents, new_val: x.assign(new_val, 'c', 'd'),
+                             lambda x, held_contents, new_val: x.update({'f': new_val}, 'c'),
+                             lambda x, held_contents, new_val: x['c'].contents.__setitem__('d', new_val),
+                             lambda x, held_contents, new_val: held_contents.__setitem__('c', new_val))
+    MUTATION_TEST_CASES = {
+    'stacked': cartesian_prod( {'a':(2,3),'b':(2,3),'c':(2,3)}, MUTATION_FUNCS ),
+    'nested': cartesian_prod( {'a':(2,3),'b':(2,3),'c':{'d':(2,3),'e':(2,3)}}, (*MUTATION_FUNCS, *NESTED_MUTATION_FUNCS) )
+    }
+    @pytest.mark.parametrize('contents, mutation_func', utils.unpack_test_cases(MUTATION_TEST_CASES), 
+                                                        ids=utils.unpack_test_ids(MUTATION_TEST_CASES),
+                                                        indirect=['contents'])
+    def test_values_after_mutation(self, contents, mutation_func):
+        
+        arraytainer = self.container_class(contents)
+        held_contents = arraytainer.contents
+        # Compute values from arraytainer before changing it, so that any stored values would be stale:
+        arraytainer.size, arraytainer.list_elements(), arraytainer + arraytainer
+
+        new_val = self.array_constructor(np.ones((4,)))
+        mutation_func(arraytainer, held_contents, new_val)
+        expected_contents = arraytainer.unpacked
+
+        # Values computed after the change should reflect the changed contents:
+        expected_arrays = utils.get_list_of_arrays(expected_contents)
+        assert arraytainer.size == sum(x.size for x in expected_arrays)
+        utils.assert_equal_values(arraytainer.list_elements(), expected_arrays)
+        expected, _ = utils.apply_func_to_contents(expected_contents, func=lambda x: x + x, throw_exception=True)
+        utils.assert_equal_values((arraytainer + arraytainer).unpacked, expected)
+        utils.assert_equal_values(np.sin(arraytainer).unpacked, utils.apply_func_to_contents(expected_contents, func=np.sin)[0])
     
     # HASH_SET_VALUES_TUPLES = tuple(tuple([x]) if isinstance(x, tuple) else x for x in HASH_SET_VALUES)
     # SET_METHOD_TEST_CASES = {
@@ -3,7 +3,6 @@ import jax.numpy as jnp
 import jaxlib
 from copy import deepcopy
 from itertools import product
-from more_itertools import always_iterable
 from arraytainers import Arraytainer, Jaxtainer
 
 ARRAYTAINER_TYPES = (Arraytainer, Jaxtainer)